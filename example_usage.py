@@ -42,8 +42,8 @@ def example_2_commit_and_push():
 
     print(f"Created sample file: {sample_file}")
 
-    # Commit the changes
-    commit_success = manager.commit_changes("Add example.txt file")
+    # Commit the changes (staging only the file we wrote)
+    commit_success = manager.commit_changes("Add example.txt file", files=[sample_file])
 
     if commit_success:
         print("Changes committed successfully!")
@@ -116,7 +116,7 @@ def example_5_full_workflow():
 
     # Step 4: Commit changes
     print("Committing changes...")
-    if not manager.commit_changes("Update workflow example"):
+    if not manager.commit_changes("Update workflow example", files=[workflow_file]):
         print("Failed to commit, exiting")
         return
 
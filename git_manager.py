@@ -4,29 +4,361 @@ Git Repository Manager
 A Python tool to clone, commit, and push to Git repositories using credentials from a config file.
 """
 
+import atexit
+import copy
+import functools
+import json
+import operator
 import os
+import re
 import sys
-from pathlib import Path
-from typing import Optional, Dict, Any
-import yaml
-from git import Repo, GitCommandError, RemoteProgress
-from git.exc import InvalidGitRepositoryError
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import quote, urlsplit, urlunsplit
 import logging
 
+# GitPython, PyYAML and pygit2 are slow to import, so they are imported on
+# first use; `git_manager.py --help` never loads them.
+# Optional libgit2 backend, bound by _import_pygit2()
+pygit2 = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# Informational messages are off by default; per-operation logging adds up in
+# scripts that commit or push many times. Set log_level in a config, or
+# configure the "git_manager" logger, to see them.
+logger.setLevel(logging.WARNING)
+
+# Parsed config files keyed by absolute path: (mtime_ns, size, config).
+# Set GIT_MANAGER_YAML_CACHE=0 to disable this in-process cache.
+_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_MAX_ENTRIES = 100
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Lets read-only git commands skip optional locks (same as git --no-optional-locks)
+_NO_OPTIONAL_LOCKS_ENV = {'GIT_OPTIONAL_LOCKS': '0'}
+
+# Serializes progress output when several repositories are processed in parallel
+_OUTPUT_LOCK = threading.Lock()
+
+# GIT_ASKPASS helper shared by all managers; it reads the credentials from the
+# environment of the git process, so the script itself holds no secrets
+_ASKPASS_SCRIPT = """#!/bin/sh
+case "$1" in
+    Username*) printf '%s\n' "$GIT_MANAGER_USERNAME" ;;
+    *) printf '%s\n' "$GIT_MANAGER_PASSWORD" ;;
+esac
+"""
+_askpass_path: Optional[str] = None
+_askpass_lock = threading.Lock()
+
+# Transfer progress lines such as "Receiving objects:  42% (420/1000)"
+_PROGRESS_LINE_RE = re.compile(r'(?:remote: )?[\w ]+: +\d+% \(')
+_null_progress_class = None
+_credential_callbacks_class = None
+
+
+def _git():
+    """
+    Import GitPython on first use.
+
+    Returns:
+        The git module
+    """
+    import git
+    return git
+
+
+def _import_pygit2() -> bool:
+    """
+    Import the optional pygit2 module into this module's namespace.
+
+    Returns:
+        True if pygit2 is available, False otherwise
+    """
+    global pygit2
+
+    if pygit2 is None:
+        try:
+            import pygit2 as module
+        except ImportError:
+            return False
+        pygit2 = module
 
+    return True
+
+
+def _yaml_loader():
+    """
+    Get the fastest available safe YAML loader.
+
+    Returns:
+        libyaml's CSafeLoader if available, otherwise the pure-Python SafeLoader
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def _get_askpass_path() -> str:
+    """
+    Write the GIT_ASKPASS helper script on first use.
+
+    Returns:
+        Path to the executable helper script
+    """
+    global _askpass_path
+    import tempfile
+
+    with _askpass_lock:
+        if _askpass_path is None:
+            fd, path = tempfile.mkstemp(prefix='git-manager-askpass-', suffix='.sh')
+            with os.fdopen(fd, 'w') as f:
+                f.write(_ASKPASS_SCRIPT)
+            os.chmod(path, 0o700)
+            atexit.register(os.remove, path)
+            _askpass_path = path
+
+    return _askpass_path
+
+
+def _null_progress():
+    """
+    Create a progress handler for push/pull that ignores transfer progress.
+
+    Progress lines are dropped before GitPython scans and regex-parses them,
+    which is most of git's stderr output on large transfers. Error and
+    ref-update lines are still recorded since GitPython builds its push and
+    fetch results from them.
+
+    Returns:
+        git.RemoteProgress instance
+    """
+    global _null_progress_class
+
+    if _null_progress_class is None:
+        class _NullProgress(_git().RemoteProgress):
+            def _parse_progress_line(self, line):
+                if isinstance(line, bytes):
+                    line = line.decode('utf-8')
+                if _PROGRESS_LINE_RE.match(line):
+                    return
+                super()._parse_progress_line(line)
+
+        _null_progress_class = _NullProgress
+
+    return _null_progress_class()
+
+
+def _credential_callbacks(userpass=None):
+    """
+    Create pygit2 remote callbacks answering credential requests.
+
+    HTTPS remotes get the configured user/password, SSH remotes a key from
+    the running ssh-agent (libgit2 has no agent fallback of its own). Each
+    credential is offered once, so bad credentials fail instead of looping.
+
+    Args:
+        userpass: pygit2.UserPass for HTTPS remotes, or None
+
+    Returns:
+        pygit2.RemoteCallbacks instance
+    """
+    global _credential_callbacks_class
+
+    if _credential_callbacks_class is None:
+        class _CredentialCallbacks(pygit2.RemoteCallbacks):
+            def __init__(self, userpass=None):
+                super().__init__()
+                self._userpass = userpass
+                self._tried = set()
+
+            def credentials(self, url, username_from_url, allowed_types):
+                import getpass
+
+                CredentialType = pygit2.enums.CredentialType
+                username = username_from_url or getpass.getuser()
+
+                if (self._userpass is not None and 'userpass' not in self._tried
+                        and allowed_types & CredentialType.USERPASS_PLAINTEXT):
+                    self._tried.add('userpass')
+                    return self._userpass
+                if 'agent' not in self._tried and allowed_types & CredentialType.SSH_KEY:
+                    self._tried.add('agent')
+                    return pygit2.KeypairFromAgent(username)
+                if 'username' not in self._tried and allowed_types & CredentialType.USERNAME:
+                    self._tried.add('username')
+                    return pygit2.Username(username)
+                raise pygit2.GitError(f"Authentication failed for {url}")
+
+        _credential_callbacks_class = _CredentialCallbacks
+
+    return _credential_callbacks_class(userpass)
+
+
+def _fast_rmtree(path: str):
+    """
+    Remove a directory tree, deleting the git object shards in parallel.
+
+    Loose objects live in independent ``.git/objects/xx`` directories, so
+    they can be unlinked concurrently; the rest of the tree is removed with
+    shutil.rmtree. Non-POSIX platforms use shutil.rmtree directly.
+
+    Args:
+        path: Directory to remove
+    """
+    import shutil
+
+    if os.name == 'posix':
+        objects_dir = os.path.join(path, '.git', 'objects')
+        try:
+            with os.scandir(objects_dir) as entries:
+                shards = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+        except (FileNotFoundError, NotADirectoryError):
+            shards = []
+
+        if len(shards) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(32, len(shards))) as executor:
+                # Consume the results so any removal error is raised here
+                list(executor.map(shutil.rmtree, shards))
+
+    shutil.rmtree(path)
+
+
+def _parse_status_v2(status: str) -> Dict[str, Any]:
+    """
+    Parse NUL-separated 'git status --porcelain=v2 -z' output.
+
+    Branch fields are only filled in when the output was produced with
+    --branch.
+
+    Args:
+        status: Output of git status --porcelain=v2 -z [--branch]
+
+    Returns:
+        Dictionary with branch, commit, upstream, ahead, behind and the
+        staged, unstaged, untracked and conflicted path lists; submodules
+        lists changed submodule paths, which also appear in staged/unstaged
+    """
+    info = {
+        'branch': None, 'commit': None, 'upstream': None, 'ahead': 0, 'behind': 0,
+        'staged': [], 'unstaged': [], 'untracked': [], 'conflicted': [],
+        'submodules': [],
+    }
+
+    entries = iter(status.split('\0'))
+    for entry in entries:
+        kind = entry[:1]
+        if kind == '#':
+            _, key, value = entry.split(' ', 2)
+            if key == 'branch.oid' and value != '(initial)':
+                info['commit'] = value
+            elif key == 'branch.head' and value != '(detached)':
+                info['branch'] = value
+            elif key == 'branch.upstream':
+                info['upstream'] = value
+            elif key == 'branch.ab':
+                ahead, behind = value.split()
+                info['ahead'], info['behind'] = int(ahead), -int(behind)
+        elif kind == '?':
+            info['untracked'].append(entry[2:])
+        elif kind == 'u':
+            info['conflicted'].append(entry.split(' ', 10)[-1])
+        elif kind in ('1', '2'):
+            # Renamed/copied entries carry a score field and are followed
+            # by the original path as a separate entry
+            fields = entry.split(' ', 8 if kind == '1' else 9)
+            path = fields[-1]
+            if kind == '2':
+                next(entries, None)
+            # The <sub> field is "N..." for files and "S<c><m><u>" for submodules
+            if fields[2][0] == 'S':
+                info['submodules'].append(path)
+            if fields[1][0] != '.':
+                info['staged'].append(path)
+            if fields[1][1] != '.':
+                info['unstaged'].append(path)
+
+    return info
+
+
+def _remove_tree_in_background(path: str) -> Optional[threading.Thread]:
+    """
+    Move a directory tree out of the way and delete it on a worker thread.
+
+    The rename is a single metadata update, so a re-clone into ``path`` can
+    start right away while the old tree is unlinked concurrently. Falls back
+    to removing the tree synchronously if it cannot be renamed (e.g. it is a
+    mount point or the parent directory is not writable).
+
+    Args:
+        path: Directory to remove
+
+    Returns:
+        The started (non-daemon) removal thread, or None if the tree was
+        removed synchronously
+    """
+    import uuid
+
+    path = os.path.normpath(path)
+    trash = f"{path}.trash.{uuid.uuid4().hex}"
+    try:
+        os.rename(path, trash)
+    except OSError as e:
+        logger.debug("Could not rename %s for background removal: %s", path, e)
+        _fast_rmtree(path)
+        return None
+
+    def remove():
+        try:
+            _fast_rmtree(trash)
+        except Exception as e:
+            logger.warning("Failed to remove old checkout %s: %s", trash, e)
 
-class CloneProgress(RemoteProgress):
-    """Progress handler for git clone operations."""
+    # Non-daemon, so the interpreter waits for the removal before exiting
+    thread = threading.Thread(target=remove, name=f"rmtree-{os.path.basename(path)}")
+    thread.start()
+    return thread
+
+
+class CloneProgress:
+    """
+    Progress handler for git clone operations.
+
+    GitPython wraps callables in its RemoteProgress machinery, so this class
+    doesn't need to subclass git.RemoteProgress (which would force importing
+    GitPython at module load).
+    """
+
+    # Redraw the bar at most this often (seconds); 100% is always shown
+    MIN_INTERVAL = 0.05
+    BAR_LENGTH = 40
+    _BAR_FILLED = '=' * BAR_LENGTH
+    _BAR_EMPTY = '-' * BAR_LENGTH
+    # RemoteProgress op_code -> name table and the mask of its keys, built
+    # lazily so GitPython is not imported at module load
+    _OP_NAMES: Optional[Dict[int, str]] = None
+    _OP_MASK = 0
 
     def __init__(self):
-        super().__init__()
         self.last_percent = -1
+        self._last_emit = 0.0
+
+    def __call__(self, op_code, cur_count, max_count=None, message=''):
+        """Forward GitPython progress callbacks to update()."""
+        self.update(op_code, cur_count, max_count, message)
 
     def update(self, op_code, cur_count, max_count=None, message=''):
         """
@@ -38,66 +370,180 @@ class CloneProgress(RemoteProgress):
             max_count: Maximum count of items to process
             message: Progress message
         """
-        if max_count:
-            percent = int((cur_count / max_count) * 100)
-            if percent != self.last_percent:
-                self.last_percent = percent
-
-                # Get operation name
-                op_name = self._get_op_name(op_code)
-
-                # Create progress bar
-                bar_length = 40
-                filled_length = int(bar_length * cur_count / max_count)
-                bar = '=' * filled_length + '-' * (bar_length - filled_length)
+        if not max_count:
+            return
 
-                # Print progress
-                print(f'\r{op_name}: [{bar}] {percent}% ({cur_count}/{max_count})', end='', flush=True)
+        percent = int((cur_count / max_count) * 100)
+        if percent == self.last_percent:
+            return
 
-                if percent == 100:
-                    print()  # New line when complete
+        now = time.monotonic()
+        if percent != 100 and now - self._last_emit < self.MIN_INTERVAL:
+            return
+        self._last_emit = now
+        self.last_percent = percent
+
+        # Get operation name
+        op_name = self._get_op_name(op_code)
+
+        # Create progress bar
+        filled_length = self.BAR_LENGTH * percent // 100
+        bar = self._BAR_FILLED[:filled_length] + self._BAR_EMPTY[filled_length:]
+
+        # Print progress
+        end = '\n' if percent == 100 else ''
+        with _OUTPUT_LOCK:
+            print(f'\r{op_name}: [{bar}] {percent}% ({cur_count}/{max_count})', end=end, flush=True)
+
+    @classmethod
+    def _op_names(cls) -> Tuple[Dict[int, str], int]:
+        """Build the op_code -> name table once, on first progress update."""
+        if cls._OP_NAMES is None:
+            RemoteProgress = _git().RemoteProgress
+            names = {
+                RemoteProgress.COUNTING: "Counting objects",
+                RemoteProgress.COMPRESSING: "Compressing objects",
+                RemoteProgress.RECEIVING: "Receiving objects",
+                RemoteProgress.RESOLVING: "Resolving deltas",
+                RemoteProgress.FINDING_SOURCES: "Finding sources",
+                RemoteProgress.CHECKING_OUT: "Checking out files",
+            }
+            cls._OP_MASK = functools.reduce(operator.or_, names)
+            cls._OP_NAMES = names
+        return cls._OP_NAMES, cls._OP_MASK
 
     def _get_op_name(self, op_code):
         """Get human-readable operation name from op_code."""
-        # RemoteProgress operation codes
-        if op_code & RemoteProgress.COUNTING:
-            return "Counting objects"
-        elif op_code & RemoteProgress.COMPRESSING:
-            return "Compressing objects"
-        elif op_code & RemoteProgress.RECEIVING:
-            return "Receiving objects"
-        elif op_code & RemoteProgress.RESOLVING:
-            return "Resolving deltas"
-        elif op_code & RemoteProgress.FINDING_SOURCES:
-            return "Finding sources"
-        elif op_code & RemoteProgress.CHECKING_OUT:
-            return "Checking out files"
-        else:
-            return "Processing"
+        names, mask = self._op_names()
+        return names.get(op_code & mask, "Processing")
 
 
 class GitRepoManager:
     """Manages Git repository operations including clone, commit, and push."""
 
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(self, config_path: str = "config.yaml", use_config_cache: bool = True):
         """
         Initialize the Git Repository Manager.
 
         Args:
             config_path: Path to the configuration YAML file
+            use_config_cache: If False, always re-parse the YAML file and
+                    skip the in-memory and JSON sidecar caches
         """
-        self.config = self._load_config(config_path)
-        self.repo: Optional[Repo] = None
+        self.logger = logger
+        self.config = self._load_config(config_path, use_config_cache)
+        self.logger = self._get_logger(config_path, self.config.get('log_level'))
+        self.backend = self._select_backend(self.config.get('backend', 'gitpython'))
+        # git.Repo for the GitPython backend, pygit2.Repository for pygit2
+        self.repo: Optional[Any] = None
+        self._user_configured = False
+        self._odb = None
+        # Background removal of the previous checkout on force re-clone
+        self._cleanup_thread = None
+        self._active_branch: Optional[str] = None
         self.repo_url = self.config['repository']['url']
+        self._url_parts = urlsplit(self.repo_url)
         self.target_dir = self.config['repository']['target_directory']
         self.branch = self.config['repository'].get('branch', 'main')
+        self.shallow = self.config['repository'].get('shallow', True)
+        self.depth = self.config['repository'].get('depth', 1)
+        # Optional partial clone filter (e.g. "blob:none"); off by default
+        self.filter = self.config['repository'].get('filter')
+        self.no_checkout = self.config['repository'].get('no_checkout', False)
+
+    @staticmethod
+    def _get_logger(config_path: str, log_level: Optional[Any]) -> logging.Logger:
+        """
+        Get the logger for a manager, honouring the config's log_level.
+
+        A configured level is set on a child logger per config file, so it
+        neither overrides the application's settings for this module nor
+        leaks into managers created from other configs.
+
+        Args:
+            config_path: Path to the configuration YAML file
+            log_level: Level name (e.g. "INFO") or number (e.g. 10) from the
+                    config, or None
+
+        Returns:
+            The module logger, or a child logger with the configured level
+        """
+        if log_level is None:
+            return logger
+
+        if isinstance(log_level, int) and not isinstance(log_level, bool):
+            level = log_level
+        else:
+            # getLevelNamesMapping() is new in Python 3.11
+            if hasattr(logging, 'getLevelNamesMapping'):
+                names = logging.getLevelNamesMapping()
+            else:
+                names = {logging.getLevelName(value): value for value in (
+                    logging.CRITICAL, logging.ERROR, logging.WARNING,
+                    logging.INFO, logging.DEBUG, logging.NOTSET)}
+            level = names.get(str(log_level).upper())
+            if level is None:
+                logger.warning("Unknown log_level '%s' in %s, ignoring it", log_level, config_path)
+                return logger
+
+        # Dots would split the logger name into hierarchy levels
+        child = logger.getChild(os.path.abspath(config_path).replace('.', '_'))
+        child.setLevel(level)
+        return child
+
+    @classmethod
+    def run_parallel(cls, config_paths: List[str], method_name: str, *args,
+                     max_workers: Optional[int] = None, use_config_cache: bool = True,
+                     **kwargs) -> Dict[str, Any]:
+        """
+        Run the same operation on several repositories concurrently.
 
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
+        Each config gets its own manager instance. Git operations are I/O
+        bound, so a thread pool is used.
+
+        Args:
+            config_paths: Paths to the configuration YAML files
+            method_name: Name of the manager method to call (e.g. 'pull_changes')
+            *args: Positional arguments passed to the method
+            max_workers: Number of worker threads (default: 3/4 of the CPUs)
+            use_config_cache: Passed through to each manager
+            **kwargs: Keyword arguments passed to the method
+
+        Returns:
+            Dictionary mapping each config path to the method's return value,
+            or None if the manager could not be created
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) * 3 // 4)
+
+        def run(config_path):
+            try:
+                manager = cls(config_path, use_config_cache=use_config_cache)
+                return getattr(manager, method_name)(*args, **kwargs)
+            except Exception as e:
+                logger.error("%s failed for %s: %s", method_name, config_path, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(run, config_paths)
+            return dict(zip(config_paths, results))
+
+    def _load_config(self, config_path: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Load configuration from YAML file.
 
+        Parsed configs are cached in memory. With GIT_MANAGER_CONFIG_SIDECAR=1
+        they are also written to a JSON sidecar next to the YAML file
+        (``config.yaml.json``), which is much faster to load on the next
+        process start. The sidecar is a second plaintext copy of the
+        credentials, so it is opt-in. Both caches are ignored once the YAML
+        file changes.
+
         Args:
             config_path: Path to the config file
+            use_cache: If False, bypass the in-memory and sidecar caches
 
         Returns:
             Dictionary containing configuration
@@ -106,19 +552,244 @@ class GitRepoManager:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file is invalid
         """
-        if not os.path.exists(config_path):
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Config file not found: {config_path}\n"
                 f"Please copy config.example.yaml to config.yaml and fill in your details."
-            )
+            ) from None
+
+        if not use_cache:
+            config = self._parse_config_file(config_path)
+            self.logger.info("Configuration loaded from %s", config_path)
+            return config
+
+        # Reuse the parsed config while the file is unchanged; hand out copies
+        # so callers mutating self.config cannot poison the cache
+        use_memory_cache = os.environ.get('GIT_MANAGER_YAML_CACHE', '1') != '0'
+        cache_key = os.path.abspath(config_path)
+        if use_memory_cache:
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(cache_key)
+                if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    _CONFIG_CACHE.move_to_end(cache_key)
+                    self.logger.info("Configuration loaded from %s (cached)", config_path)
+                    return copy.deepcopy(cached[2])
+
+        if os.environ.get('GIT_MANAGER_CONFIG_SIDECAR', '0') == '1':
+            sidecar_path = config_path + '.json'
+            config = self._load_config_sidecar(sidecar_path, st)
+            if config is None:
+                config = self._parse_config_file(config_path)
+                self._write_config_sidecar(sidecar_path, config, st)
+        else:
+            config = self._parse_config_file(config_path)
+
+        if use_memory_cache:
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config)
+                _CONFIG_CACHE.move_to_end(cache_key)
+                if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_ENTRIES:
+                    _CONFIG_CACHE.popitem(last=False)
+
+        self.logger.info("Configuration loaded from %s", config_path)
+        return copy.deepcopy(config)
+
+    def _parse_config_file(self, config_path: str) -> Dict[str, Any]:
+        """
+        Parse the YAML config file.
 
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        Args:
+            config_path: Path to the config file
+
+        Returns:
+            Dictionary containing configuration
+        """
+        import yaml
 
-        logger.info(f"Configuration loaded from {config_path}")
-        return config
+        # One binary read instead of PyYAML pulling the stream in small chunks;
+        # the YAML reader detects the encoding (and any BOM) from the bytes
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        return yaml.load(data, Loader=_yaml_loader())
 
-    def _get_authenticated_url(self) -> str:
+    def _load_config_sidecar(self, sidecar_path: str, config_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Load the JSON sidecar cache if it was written for the current YAML file.
+
+        The sidecar records the (mtime_ns, size) of the YAML file it was built
+        from and is only used on an exact match; a newer sidecar mtime alone is
+        not enough, since cp -p, tar or rsync can restore an older mtime.
+
+        Args:
+            sidecar_path: Path to the JSON sidecar
+            config_stat: os.stat() result of the YAML config file
+
+        Returns:
+            Cached configuration, or None if the sidecar is missing or stale
+        """
+        try:
+            with open(sidecar_path, 'rb') as f:
+                data = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if (not isinstance(data, dict) or 'config' not in data
+                or data.get('source') != [config_stat.st_mtime_ns, config_stat.st_size]):
+            return None
+        return data['config']
+
+    def _write_config_sidecar(self, sidecar_path: str, config: Dict[str, Any],
+                              config_stat: os.stat_result):
+        """
+        Atomically write the parsed configuration to the JSON sidecar.
+
+        Failures are not fatal; the YAML file is simply parsed again next time.
+
+        Args:
+            sidecar_path: Path to the JSON sidecar
+            config: Parsed configuration
+            config_stat: os.stat() result of the YAML file the config came from
+        """
+        directory = os.path.dirname(os.path.abspath(sidecar_path))
+        if not os.access(directory, os.W_OK):
+            return
+
+        import tempfile
+
+        tmp_path = None
+        try:
+            # mkstemp creates the file with 0600, the sidecar holds credentials
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'source': [config_stat.st_mtime_ns, config_stat.st_size],
+                    'config': config,
+                }, f)
+            os.replace(tmp_path, sidecar_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug("Could not write config cache %s: %s", sidecar_path, e)
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _select_backend(self, backend: str) -> str:
+        """
+        Resolve the configured git backend.
+
+        Args:
+            backend: Backend name from config ('gitpython' or 'pygit2')
+
+        Returns:
+            Backend that will actually be used
+        """
+        if backend == 'pygit2':
+            if not _import_pygit2():
+                self.logger.warning("pygit2 is not installed, falling back to GitPython backend")
+                return 'gitpython'
+            return 'pygit2'
+
+        if backend != 'gitpython':
+            self.logger.warning("Unknown backend '%s', using GitPython backend", backend)
+        return 'gitpython'
+
+    def _open_repo(self):
+        """
+        Open the repository at the target directory with the active backend.
+
+        Returns:
+            git.Repo or pygit2.Repository instance
+
+        Raises:
+            InvalidGitRepositoryError: If the directory is not a git repository
+        """
+        if self.backend == 'pygit2':
+            try:
+                return pygit2.Repository(
+                    self.target_dir,
+                    flags=pygit2.enums.RepositoryOpenFlag.NO_SEARCH
+                )
+            except pygit2.GitError as e:
+                raise _git().exc.InvalidGitRepositoryError(self.target_dir) from e
+
+        repo = _git().Repo(self.target_dir)
+        if self._git_env:
+            repo.git.update_environment(**self._git_env)
+        return repo
+
+    @cached_property
+    def _git_env(self) -> Dict[str, str]:
+        """
+        Environment for GitPython's git commands, built on first use.
+
+        Empty for the pygit2 backend, which passes credentials via callbacks.
+        """
+        if self.backend != 'gitpython':
+            return {}
+        return self._build_git_env()
+
+    @cached_property
+    def _remote_url(self) -> str:
+        """
+        URL stored for the remote, resolved on the first remote operation.
+
+        With GIT_ASKPASS (or the pygit2 backend) the plain URL suffices,
+        otherwise credentials are embedded in it.
+        """
+        if self.backend != 'gitpython' or 'GIT_ASKPASS' in self._git_env:
+            return self.repo_url
+        return self._build_authenticated_url()
+
+    def _build_git_env(self) -> Dict[str, str]:
+        """
+        Build the environment that lets git obtain HTTPS credentials.
+
+        On POSIX systems credentials are answered by a GIT_ASKPASS helper
+        instead of being embedded in the remote URL, so they never end up
+        in .git/config. Terminal prompts are always disabled: missing or
+        wrong credentials make git fail instead of waiting for input.
+
+        Returns:
+            Environment variables for git commands
+        """
+        env = {'GIT_TERMINAL_PROMPT': '0'}
+
+        credentials = self.config.get('credentials', {})
+        username = credentials.get('username')
+        password = credentials.get('password')
+
+        if (os.name != 'posix' or not username or not password
+                or self._url_parts.scheme not in ('http', 'https')):
+            return env
+
+        env.update({
+            'GIT_ASKPASS': _get_askpass_path(),
+            # YAML loads numeric values (e.g. a PIN-like password) as int
+            'GIT_MANAGER_USERNAME': str(username),
+            'GIT_MANAGER_PASSWORD': str(password),
+        })
+        return env
+
+    def _get_remote_callbacks(self):
+        """
+        Create pygit2 remote callbacks carrying the configured credentials.
+
+        SSH remotes authenticate through the ssh-agent.
+
+        Returns:
+            pygit2.RemoteCallbacks instance
+        """
+        credentials = self.config.get('credentials', {})
+        username = credentials.get('username')
+        password = credentials.get('password')
+
+        if username and password and self._url_parts.scheme in ('http', 'https'):
+            # str(): YAML loads numeric credentials as int
+            return _credential_callbacks(pygit2.UserPass(str(username), str(password)))
+
+        return _credential_callbacks()
+
+    def _build_authenticated_url(self) -> str:
         """
         Create an authenticated Git URL with credentials.
 
@@ -130,27 +801,23 @@ class GitRepoManager:
         password = credentials.get('password')
 
         if not username or not password:
-            logger.warning("No credentials found in config, using URL as-is")
+            self.logger.warning("No credentials found in config, using URL as-is")
             return self.repo_url
 
-        # Parse the URL and inject credentials
-        if self.repo_url.startswith('https://'):
-            # Remove https:// prefix
-            url_without_protocol = self.repo_url[8:]
-            # Create authenticated URL
-            authenticated_url = f"https://{username}:{password}@{url_without_protocol}"
-            return authenticated_url
-        elif self.repo_url.startswith('http://'):
-            # Remove http:// prefix
-            url_without_protocol = self.repo_url[7:]
-            # Create authenticated URL
-            authenticated_url = f"http://{username}:{password}@{url_without_protocol}"
-            return authenticated_url
-        else:
+        parts = self._url_parts
+        if parts.scheme not in ('http', 'https'):
             # For SSH URLs, return as-is
-            logger.info("Using SSH URL, credentials from config will be ignored")
+            self.logger.info("Using SSH URL, credentials from config will be ignored")
             return self.repo_url
 
+        # Replace any user info already in the URL; keep host, port and IPv6
+        # brackets exactly as written
+        host = parts.netloc.rpartition('@')[2]
+        # Quote credentials so that '@', ':' or '/' in them are safe
+        # (str() first: YAML loads numeric credentials as int)
+        userinfo = f"{quote(str(username), safe='')}:{quote(str(password), safe='')}"
+        return urlunsplit(parts._replace(netloc=f"{userinfo}@{host}"))
+
     def clone_repository(self, force: bool = False) -> bool:
         """
         Clone the repository to the target directory.
@@ -162,54 +829,115 @@ class GitRepoManager:
             True if successful, False otherwise
         """
         try:
-            target_path = Path(self.target_dir)
+            # A single stat of .git tells whether a repository is already there
+            try:
+                os.stat(os.path.join(self.target_dir, '.git'))
+                is_repo = True
+            except (FileNotFoundError, NotADirectoryError):
+                is_repo = False
 
             # Check if directory already exists
-            if target_path.exists():
+            if is_repo or os.path.exists(self.target_dir):
                 if force:
-                    logger.warning(f"Removing existing directory: {self.target_dir}")
-                    import shutil
-                    shutil.rmtree(self.target_dir)
+                    self.logger.warning("Removing existing directory: %s", self.target_dir)
+                    self._cleanup_thread = _remove_tree_in_background(self.target_dir)
+                elif not is_repo:
+                    self.logger.error(
+                        "Directory exists but is not a git repository: %s\n"
+                        "Use force=True to remove and re-clone",
+                        self.target_dir
+                    )
+                    return False
                 else:
                     # Try to open existing repo
                     try:
-                        self.repo = Repo(self.target_dir)
-                        logger.info(f"Repository already exists at {self.target_dir}")
+                        self.repo = self._open_repo()
+                        self.logger.info("Repository already exists at %s", self.target_dir)
                         return True
-                    except InvalidGitRepositoryError:
-                        logger.error(
-                            f"Directory exists but is not a git repository: {self.target_dir}\n"
-                            f"Use force=True to remove and re-clone"
+                    except _git().exc.InvalidGitRepositoryError:
+                        self.logger.error(
+                            "Directory exists but is not a git repository: %s\n"
+                            "Use force=True to remove and re-clone",
+                            self.target_dir
                         )
                         return False
 
             # Clone the repository
-            logger.info(f"Cloning repository from {self.repo_url}")
-            authenticated_url = self._get_authenticated_url()
+            self.logger.info("Cloning repository from %s", self.repo_url)
+            self._active_branch = None
+
+            if self.backend == 'pygit2':
+                # Like git, ignore depth for local clones (libgit2 rejects it)
+                is_local = self._url_parts.scheme == 'file' or (
+                    not self._url_parts.scheme and ':' not in self.repo_url.split('/', 1)[0]
+                )
+                self.repo = pygit2.clone_repository(
+                    self.repo_url,
+                    self.target_dir,
+                    checkout_branch=self.branch,
+                    callbacks=self._get_remote_callbacks(),
+                    depth=self.depth if self.shallow and not is_local else 0
+                )
+                # The clone checks out the configured branch
+                self._active_branch = self.branch
+                self._configure_git_user()
+                self._user_configured = True
+                self.logger.info("Repository cloned successfully to %s", self.target_dir)
+                return True
 
             # Create progress handler
             progress = CloneProgress()
 
-            self.repo = Repo.clone_from(
-                authenticated_url,
+            self.repo = _git().Repo.clone_from(
+                self._remote_url,
                 self.target_dir,
                 branch=self.branch,
-                progress=progress
+                progress=progress,
+                multi_options=self._get_clone_options(),
+                env=self._git_env
             )
+            if self._git_env:
+                self.repo.git.update_environment(**self._git_env)
+
+            # The clone checks out the configured branch
+            self._active_branch = self.branch
 
             # Configure git user for commits
             self._configure_git_user()
+            self._user_configured = True
 
-            logger.info(f"Repository cloned successfully to {self.target_dir}")
+            self.logger.info("Repository cloned successfully to %s", self.target_dir)
             return True
 
-        except GitCommandError as e:
-            logger.error(f"Git command failed: {e}")
+        except _git().GitCommandError as e:
+            self.logger.error("Git command failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Failed to clone repository: {e}")
+            self.logger.error("Failed to clone repository: %s", e)
             return False
 
+    def _get_clone_options(self) -> list:
+        """
+        Build extra command line options for git clone.
+
+        Shallow clones fetch only the configured branch and the last ``depth``
+        commits. A partial clone ``filter`` (e.g. "blob:none", "tree:0") leaves
+        objects outside of the checkout on the server until they are needed.
+
+        Returns:
+            List of options for Repo.clone_from(multi_options=...)
+        """
+        options = []
+
+        if self.shallow:
+            options += [f'--depth={self.depth}', '--single-branch']
+        if self.filter:
+            options.append(f'--filter={self.filter}')
+        if self.no_checkout:
+            options.append('--no-checkout')
+
+        return options
+
     def _configure_git_user(self):
         """Configure git user name and email from config."""
         if not self.repo:
@@ -219,13 +947,34 @@ class GitRepoManager:
         name = git_user.get('name')
         email = git_user.get('email')
 
-        if name:
-            self.repo.config_writer().set_value("user", "name", name).release()
-            logger.info(f"Configured git user name: {name}")
+        # Nothing configured, don't touch the repository config at all
+        if not name and not email:
+            return
+
+        if self.backend == 'pygit2':
+            config = self.repo.config
+            for key, value in (('user.name', name), ('user.email', email)):
+                if value and (key not in config or config[key] != value):
+                    config[key] = value
+                    self.logger.info("Configured git %s: %s", key.replace('.', ' '), value)
+            return
+
+        # Skip the write entirely when the repository already has these values
+        reader = self.repo.config_reader('repository')
+        name_changed = bool(name) and reader.get_value('user', 'name', '') != name
+        email_changed = bool(email) and reader.get_value('user', 'email', '') != email
+        if not name_changed and not email_changed:
+            return
+
+        # One writer, so .git/config is parsed and written only once
+        with self.repo.config_writer() as writer:
+            if name_changed:
+                writer.set_value("user", "name", name)
+                self.logger.info("Configured git user name: %s", name)
 
-        if email:
-            self.repo.config_writer().set_value("user", "email", email).release()
-            logger.info(f"Configured git user email: {email}")
+            if email_changed:
+                writer.set_value("user", "email", email)
+                self.logger.info("Configured git user email: %s", email)
 
     def _ensure_repo_loaded(self) -> bool:
         """
@@ -236,18 +985,80 @@ class GitRepoManager:
         """
         if self.repo is None:
             try:
-                self.repo = Repo(self.target_dir)
-                self._configure_git_user()
+                self.repo = self._open_repo()
+                if not self._user_configured:
+                    self._configure_git_user()
+                    self._user_configured = True
                 return True
-            except InvalidGitRepositoryError:
-                logger.error(
-                    f"No git repository found at {self.target_dir}\n"
-                    f"Please clone the repository first using clone_repository()"
+            except _git().exc.InvalidGitRepositoryError:
+                self.logger.error(
+                    "No git repository found at %s\n"
+                    "Please clone the repository first using clone_repository()",
+                    self.target_dir
                 )
                 return False
         return True
 
-    def commit_changes(self, message: str, add_all: bool = None) -> bool:
+    @property
+    def active_branch(self) -> Optional[str]:
+        """
+        Name of the checked out branch.
+
+        Resolving HEAD reads from disk, so the name is cached until the
+        branch is changed through checkout(). None when HEAD is detached.
+        """
+        if self._active_branch is None:
+            if self.backend == 'pygit2':
+                if not self.repo.head_is_detached:
+                    self._active_branch = self.repo.head.shorthand
+            else:
+                try:
+                    self._active_branch = self.repo.active_branch.name
+                except TypeError:
+                    # Raised by GitPython for a detached HEAD
+                    pass
+        return self._active_branch
+
+    def checkout(self, branch: str) -> bool:
+        """
+        Check out a branch, creating it from the remote branch if needed.
+
+        Args:
+            branch: Name of the branch to check out
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._ensure_repo_loaded():
+            return False
+
+        try:
+            if self.backend == 'pygit2':
+                ref = self.repo.lookup_branch(branch)
+                if ref is None:
+                    remote_ref = self.repo.lookup_branch(f"origin/{branch}", pygit2.GIT_BRANCH_REMOTE)
+                    if remote_ref is None:
+                        self.logger.error("Branch not found: %s", branch)
+                        return False
+                    ref = self.repo.branches.local.create(branch, self.repo[remote_ref.target])
+                    ref.upstream = remote_ref
+                self.repo.checkout(ref)
+            else:
+                self.repo.git.checkout(branch)
+
+            self._active_branch = branch
+            self.logger.info("Checked out branch %s", branch)
+            return True
+
+        except _git().GitCommandError as e:
+            self.logger.error("Git checkout failed: %s", e)
+            return False
+        except Exception as e:
+            self.logger.error("Failed to check out branch: %s", e)
+            return False
+
+    def commit_changes(self, message: str, add_all: bool = None,
+                       files: Optional[List[str]] = None) -> bool:
         """
         Commit changes to the repository.
 
@@ -255,6 +1066,10 @@ class GitRepoManager:
             message: Commit message
             add_all: If True, add all changes before commit.
                     If None, use config default.
+            files: Stage only these files (relative to the repository root,
+                    into the repository from the current directory, or
+                    absolute) instead of scanning the whole working tree.
+                    Takes precedence over add_all.
 
         Returns:
             True if successful, False otherwise
@@ -267,28 +1082,180 @@ class GitRepoManager:
             if add_all is None:
                 add_all = self.config.get('commit_settings', {}).get('auto_add_all', True)
 
-            # Add changes
-            if add_all:
-                self.repo.git.add(A=True)
-                logger.info("Added all changes to staging area")
+            if self.backend == 'pygit2':
+                return self._commit_changes_pygit2(message, add_all, files)
+
+            if files:
+                # Stage just the given paths, no full worktree scan; git add
+                # honours .gitignore and .gitattributes filters
+                existing, deleted = self._split_paths(files)
+                entries = self.repo.index.entries
+                deleted = self._tracked_paths(deleted, lambda path: (path, 0) in entries)
+                if existing:
+                    self.repo.git.add('--', *existing)
+                if deleted:
+                    self.repo.git.rm('--cached', '--', *deleted)
+                self.logger.info("Added %d path(s) to staging area", len(existing) + len(deleted))
+
+                has_changes = not self.repo.head.is_valid() or bool(self.repo.index.diff('HEAD'))
+            else:
+                include_untracked = self.config.get('commit_settings', {}).get('include_untracked', True)
+
+                # One worktree scan answers both questions; checking first
+                # skips staging on a clean tree
+                dirty, untracked = self._worktree_state(include_untracked)
+                has_changes = dirty or bool(untracked)
+
+                # Add changes; git add applies .gitattributes filters and
+                # handles submodules and merge conflicts correctly
+                if has_changes and add_all:
+                    if include_untracked:
+                        self.repo.git.add(A=True)
+                    else:
+                        # 'git add -u' skips the untracked-file walk
+                        self.repo.git.add(update=True)
+                    self.logger.info("Added all changes to staging area")
 
             # Check if there are changes to commit
-            if not self.repo.is_dirty() and not self.repo.untracked_files:
-                logger.warning("No changes to commit")
+            if not has_changes:
+                self.logger.warning("No changes to commit")
                 return True
 
             # Commit changes
             commit = self.repo.index.commit(message)
-            logger.info(f"Changes committed successfully: {commit.hexsha[:7]} - {message}")
+            self.logger.info("Changes committed successfully: %s - %s", commit.hexsha[:7], message)
             return True
 
-        except GitCommandError as e:
-            logger.error(f"Git commit failed: {e}")
+        except _git().GitCommandError as e:
+            self.logger.error("Git commit failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Failed to commit changes: {e}")
+            self.logger.error("Failed to commit changes: %s", e)
             return False
 
+    def _commit_changes_pygit2(self, message: str, add_all: bool,
+                               files: Optional[List[str]] = None) -> bool:
+        """
+        Commit changes in-process through libgit2.
+
+        Args:
+            message: Commit message
+            add_all: If True, stage all changes (including deletions) first
+            files: Stage only these files instead
+
+        Returns:
+            True if successful
+        """
+        index = self.repo.index
+
+        if files:
+            existing, deleted = self._split_paths(files)
+            for path in existing:
+                index.add(path)
+            deleted = self._tracked_paths(deleted, lambda path: path in index)
+            for path in deleted:
+                index.remove(path)
+            index.write()
+            self.logger.info("Added %d path(s) to staging area", len(existing) + len(deleted))
+        elif add_all:
+            index.add_all()
+            for path, flags in self.repo.status().items():
+                if flags & pygit2.GIT_STATUS_WT_DELETED:
+                    index.remove(path)
+            index.write()
+            self.logger.info("Added all changes to staging area")
+
+        tree = index.write_tree()
+        parents = [] if self.repo.head_is_unborn else [self.repo.head.target]
+
+        # Check if there are changes to commit
+        if parents and self.repo[parents[0]].tree_id == tree:
+            self.logger.warning("No changes to commit")
+            return True
+
+        signature = self.repo.default_signature
+        commit_id = self.repo.create_commit('HEAD', signature, signature, message, tree, parents)
+        self.logger.info("Changes committed successfully: %s - %s", str(commit_id)[:7], message)
+        return True
+
+    def _worktree_state(self, include_untracked: bool = True) -> Tuple[bool, List[str]]:
+        """
+        Scan the working tree once with 'git status --porcelain=v2 -z'.
+
+        Rename detection is turned off, it is not needed to decide whether
+        there is anything to commit and is expensive on large trees.
+
+        Args:
+            include_untracked: Whether to list untracked files
+
+        Returns:
+            Tuple of (dirty, untracked): whether any tracked path differs
+            from HEAD, and the untracked file paths
+        """
+        status = self.repo.git.status(
+            '--porcelain=v2', '-z', '--no-renames',
+            '--untracked-files=all' if include_untracked else '--untracked-files=no'
+        )
+
+        info = _parse_status_v2(status)
+        dirty = bool(info['staged'] or info['unstaged'] or info['conflicted'])
+        return dirty, info['untracked']
+
+    def _split_paths(self, files: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Split paths into files present in the working tree and deleted files.
+
+        Relative paths are taken as relative to the repository root, unless
+        no such file exists there and the path points into the repository
+        from the current directory (e.g. os.path.join(target_dir, name) with
+        a relative target_dir).
+
+        Args:
+            files: Paths relative to the repository root or the current
+                    directory, or absolute paths
+
+        Returns:
+            Tuple of (existing, deleted) paths relative to the repository root
+        """
+        root = os.path.abspath(self.target_dir)
+        existing, deleted = [], []
+
+        for path in files:
+            if os.path.isabs(path):
+                path = os.path.relpath(path, root)
+            elif not os.path.lexists(os.path.join(root, path)):
+                absolute = os.path.abspath(path)
+                if absolute.startswith(root + os.sep):
+                    path = os.path.relpath(absolute, root)
+            # The index always uses forward slashes
+            path = os.path.normpath(path).replace(os.sep, '/')
+            if os.path.lexists(os.path.join(root, path)):
+                existing.append(path)
+            else:
+                deleted.append(path)
+
+        return existing, deleted
+
+    @staticmethod
+    def _tracked_paths(paths: List[str], is_tracked) -> List[str]:
+        """
+        Keep only the paths present in the index, warning about the others.
+
+        Args:
+            paths: Paths relative to the repository root
+            is_tracked: Callable telling whether a path is in the index
+
+        Returns:
+            The tracked paths
+        """
+        tracked = []
+        for path in paths:
+            if is_tracked(path):
+                tracked.append(path)
+            else:
+                logger.warning("Ignoring %s: not in the working tree or the index", path)
+        return tracked
+
     def push_changes(self, remote: str = "origin", branch: str = None) -> bool:
         """
         Push changes to remote repository.
@@ -304,40 +1271,144 @@ class GitRepoManager:
             return False
 
         try:
-            # Determine branch
+            # Determine branch; pushing the config branch from a detached
+            # HEAD would leave the detached commits behind
             if branch is None:
-                branch = self.repo.active_branch.name
+                branch = self.active_branch
+                if branch is None:
+                    self.logger.error("HEAD is detached; check out a branch or pass branch= to push")
+                    return False
 
-            # Update remote URL with credentials if needed
-            authenticated_url = self._get_authenticated_url()
+            if self.backend == 'pygit2':
+                return self._push_changes_pygit2(remote, branch)
 
-            # Get or create remote
-            if remote in [r.name for r in self.repo.remotes]:
-                remote_obj = self.repo.remote(remote)
-                # Update URL with credentials
-                remote_obj.set_url(authenticated_url)
-            else:
-                remote_obj = self.repo.create_remote(remote, authenticated_url)
+            remote_obj = self._get_remote(remote)
 
             # Push changes
-            logger.info(f"Pushing changes to {remote}/{branch}")
-            push_info = remote_obj.push(branch)
+            self.logger.info("Pushing changes to %s/%s", remote, branch)
+            # A fully qualified refspec skips git's "matching ref" lookup
+            push_info = remote_obj.push(
+                f"refs/heads/{branch}:refs/heads/{branch}",
+                progress=_null_progress(),
+                **self._get_push_options()
+            )
 
-            # Check push result
-            if push_info and push_info[0].flags & push_info[0].ERROR:
-                logger.error(f"Push failed: {push_info[0].summary}")
+            # Check the result of every pushed ref
+            failed = [info for info in push_info if info.flags & info.ERROR]
+            if failed:
+                for info in failed:
+                    self.logger.error("Push failed: %s", info.summary.strip())
                 return False
 
-            logger.info("Changes pushed successfully")
+            self.logger.info("Changes pushed successfully")
             return True
 
-        except GitCommandError as e:
-            logger.error(f"Git push failed: {e}")
+        except _git().GitCommandError as e:
+            self.logger.error("Git push failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Failed to push changes: {e}")
+            self.logger.error("Failed to push changes: %s", e)
+            return False
+
+    def _get_push_options(self) -> Dict[str, bool]:
+        """
+        Build optional git push flags from the push_settings config section.
+
+        Returns:
+            Keyword arguments for Remote.push()
+        """
+        settings = self.config.get('push_settings', {})
+        options = {}
+
+        for key in ('atomic', 'no_verify', 'force_with_lease'):
+            if settings.get(key, False):
+                options[key] = True
+
+        return options
+
+    def _get_remote(self, remote: str):
+        """
+        Get or create a GitPython remote pointing at the configured URL.
+
+        The stored URL carries credentials only when GIT_ASKPASS cannot supply
+        them. .git/config is rewritten only if the URL actually changed, e.g.
+        to drop credentials embedded by an older clone.
+
+        Args:
+            remote: Name of the remote
+
+        Returns:
+            The git.Remote object
+        """
+        try:
+            remote_obj = self.repo.remote(remote)
+        except ValueError:
+            return self.repo.create_remote(remote, self._remote_url)
+
+        if remote_obj.url != self._remote_url:
+            remote_obj.set_url(self._remote_url)
+        return remote_obj
+
+    def _refresh_remote_credentials(self, remote_obj):
+        """
+        Update credentials embedded in a remote's URL, leaving anything else alone.
+
+        Only a remote whose URL is the configured repository URL plus user
+        info (e.g. written by an older clone) is touched; it is switched to
+        the URL this manager would store now, which drops the credentials
+        when GIT_ASKPASS supplies them.
+
+        Args:
+            remote_obj: git.Remote to check
+        """
+        current = urlsplit(remote_obj.url)
+        if '@' not in current.netloc or current.scheme not in ('http', 'https'):
+            return
+
+        configured = self._url_parts
+        same_repo = (
+            current._replace(netloc=current.netloc.rpartition('@')[2])
+            == configured._replace(netloc=configured.netloc.rpartition('@')[2])
+        )
+        if same_repo and remote_obj.url != self._remote_url:
+            remote_obj.set_url(self._remote_url)
+
+    def _push_changes_pygit2(self, remote: str, branch: str) -> bool:
+        """
+        Push changes in-process through libgit2.
+
+        Args:
+            remote: Name of the remote
+            branch: Branch to push to
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Get or create remote; credentials travel through callbacks, not the URL
+        try:
+            remote_obj = self.repo.remotes[remote]
+        except KeyError:
+            remote_obj = self.repo.remotes.create(remote, self.repo_url)
+
+        rejected = []
+
+        def record_rejection(refname, message):
+            if message is not None:
+                rejected.append(f"{refname}: {message}")
+
+        callbacks = self._get_remote_callbacks()
+        callbacks.push_update_reference = record_rejection
+
+        self.logger.info("Pushing changes to %s/%s", remote, branch)
+        remote_obj.push([f"refs/heads/{branch}:refs/heads/{branch}"], callbacks=callbacks)
+
+        if rejected:
+            self.logger.error("Push failed: %s", '; '.join(rejected))
             return False
 
+        self.logger.info("Changes pushed successfully")
+        return True
+
     def get_status(self) -> Optional[str]:
         """
         Get the current repository status.
@@ -349,12 +1420,139 @@ class GitRepoManager:
             return None
 
         try:
-            status = self.repo.git.status()
+            if self.backend == 'pygit2':
+                return self._get_status_pygit2()
+
+            # Read-only query: don't take the index lock to refresh stat data,
+            # so status neither waits for nor blocks concurrent git processes
+            status = self.repo.git.status(env=_NO_OPTIONAL_LOCKS_ENV)
             return status
         except Exception as e:
-            logger.error(f"Failed to get status: {e}")
+            self.logger.error("Failed to get status: %s", e)
             return None
 
+    def get_status_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the repository status as structured data.
+
+        Uses machine-readable 'git status --porcelain=v2 --branch' output,
+        which is cheaper to produce than the human-readable format.
+
+        Returns:
+            Dictionary with keys branch (None when detached), commit (None
+            before the first commit), upstream, ahead, behind, and the
+            staged, unstaged, untracked, conflicted and submodules path
+            lists; None if the repo is not loaded
+        """
+        if not self._ensure_repo_loaded():
+            return None
+
+        try:
+            if self.backend == 'pygit2':
+                return self._get_status_info_pygit2()
+
+            status = self.repo.git.status(
+                '--porcelain=v2', '--branch', '-z', env=_NO_OPTIONAL_LOCKS_ENV
+            )
+            return _parse_status_v2(status)
+        except Exception as e:
+            self.logger.error("Failed to get status: %s", e)
+            return None
+
+    def _get_status_info_pygit2(self) -> Dict[str, Any]:
+        """
+        Build structured status from libgit2's status map.
+
+        Returns:
+            Dictionary in the same format as get_status_info()
+        """
+        info = {
+            'branch': None, 'commit': None, 'upstream': None, 'ahead': 0, 'behind': 0,
+            'staged': [], 'unstaged': [], 'untracked': [], 'conflicted': [],
+            'submodules': [],
+        }
+
+        if self.repo.head_is_unborn:
+            # HEAD still names the branch the first commit will create
+            info['branch'] = self.repo.references['HEAD'].target.replace('refs/heads/', '', 1)
+        else:
+            info['commit'] = str(self.repo.head.target)
+            if not self.repo.head_is_detached:
+                info['branch'] = self.repo.head.shorthand
+                local = self.repo.branches.local.get(info['branch'])
+                upstream = local.upstream if local is not None else None
+                if upstream is not None:
+                    info['upstream'] = upstream.shorthand
+                    info['ahead'], info['behind'] = self.repo.ahead_behind(
+                        local.target, upstream.target
+                    )
+
+        index_flags = (pygit2.GIT_STATUS_INDEX_NEW | pygit2.GIT_STATUS_INDEX_MODIFIED
+                       | pygit2.GIT_STATUS_INDEX_DELETED | pygit2.GIT_STATUS_INDEX_RENAMED
+                       | pygit2.GIT_STATUS_INDEX_TYPECHANGE)
+        worktree_flags = (pygit2.GIT_STATUS_WT_MODIFIED | pygit2.GIT_STATUS_WT_DELETED
+                          | pygit2.GIT_STATUS_WT_RENAMED | pygit2.GIT_STATUS_WT_TYPECHANGE)
+
+        submodule_paths = set(self.repo.listall_submodules())
+
+        for path, flags in sorted(self.repo.status().items()):
+            if flags & pygit2.GIT_STATUS_CONFLICTED:
+                info['conflicted'].append(path)
+                continue
+            if path in submodule_paths:
+                info['submodules'].append(path)
+            if flags & pygit2.GIT_STATUS_WT_NEW:
+                info['untracked'].append(path)
+            if flags & index_flags:
+                info['staged'].append(path)
+            if flags & worktree_flags:
+                info['unstaged'].append(path)
+
+        return info
+
+    def _get_status_pygit2(self) -> str:
+        """
+        Build a short-format status string from libgit2's status map.
+
+        Returns:
+            Status string with one 'XY path' line per changed file
+        """
+        index_codes = (
+            (pygit2.GIT_STATUS_INDEX_NEW, 'A'),
+            (pygit2.GIT_STATUS_INDEX_MODIFIED, 'M'),
+            (pygit2.GIT_STATUS_INDEX_DELETED, 'D'),
+            (pygit2.GIT_STATUS_INDEX_RENAMED, 'R'),
+            (pygit2.GIT_STATUS_INDEX_TYPECHANGE, 'T'),
+        )
+        worktree_codes = (
+            (pygit2.GIT_STATUS_WT_MODIFIED, 'M'),
+            (pygit2.GIT_STATUS_WT_DELETED, 'D'),
+            (pygit2.GIT_STATUS_WT_RENAMED, 'R'),
+            (pygit2.GIT_STATUS_WT_TYPECHANGE, 'T'),
+        )
+
+        if self.repo.head_is_unborn:
+            lines = ["No commits yet"]
+        else:
+            lines = [f"On branch {self.repo.head.shorthand}"]
+
+        changes = sorted(self.repo.status().items())
+        for path, flags in changes:
+            if flags & pygit2.GIT_STATUS_CONFLICTED:
+                code = 'UU'
+            elif flags & pygit2.GIT_STATUS_WT_NEW:
+                code = '??'
+            else:
+                x = next((c for f, c in index_codes if flags & f), ' ')
+                y = next((c for f, c in worktree_codes if flags & f), ' ')
+                code = x + y
+            lines.append(f"{code} {path}")
+
+        if not changes:
+            lines.append("nothing to commit, working tree clean")
+
+        return "\n".join(lines)
+
     def pull_changes(self, remote: str = "origin", branch: str = None) -> bool:
         """
         Pull changes from remote repository.
@@ -371,22 +1569,226 @@ class GitRepoManager:
 
         try:
             if branch is None:
-                branch = self.repo.active_branch.name
+                branch = self.active_branch
+                if branch is None:
+                    self.logger.error("HEAD is detached; check out a branch or pass branch= to pull")
+                    return False
+
+            if self.backend == 'pygit2':
+                return self._pull_changes_pygit2(remote, branch)
 
-            logger.info(f"Pulling changes from {remote}/{branch}")
+            self.logger.info("Pulling changes from %s/%s", remote, branch)
             remote_obj = self.repo.remote(remote)
-            remote_obj.pull(branch)
+            self._refresh_remote_credentials(remote_obj)
+            remote_obj.pull(branch, progress=_null_progress())
 
-            logger.info("Changes pulled successfully")
+            self.logger.info("Changes pulled successfully")
             return True
 
-        except GitCommandError as e:
-            logger.error(f"Git pull failed: {e}")
+        except _git().GitCommandError as e:
+            self.logger.error("Git pull failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Failed to pull changes: {e}")
+            self.logger.error("Failed to pull changes: %s", e)
             return False
 
+    def _pull_changes_pygit2(self, remote: str, branch: str) -> bool:
+        """
+        Fetch and merge remote changes in-process through libgit2.
+
+        Args:
+            remote: Name of the remote
+            branch: Branch to pull from
+
+        Returns:
+            True if successful, False otherwise
+        """
+        self.logger.info("Pulling changes from %s/%s", remote, branch)
+        self.repo.remotes[remote].fetch(callbacks=self._get_remote_callbacks())
+
+        remote_target = self.repo.lookup_reference(f"refs/remotes/{remote}/{branch}").target
+        analysis, _ = self.repo.merge_analysis(remote_target)
+
+        if analysis & pygit2.GIT_MERGE_ANALYSIS_UP_TO_DATE:
+            self.logger.info("Already up to date")
+            return True
+
+        if analysis & pygit2.GIT_MERGE_ANALYSIS_FASTFORWARD:
+            self.repo.checkout_tree(self.repo[remote_target])
+            self.repo.head.set_target(remote_target)
+        else:
+            self.repo.merge(remote_target)
+            if self.repo.index.conflicts is not None:
+                self.logger.error("Git pull failed: merge conflicts must be resolved manually")
+                return False
+
+            tree = self.repo.index.write_tree()
+            signature = self.repo.default_signature
+            self.repo.create_commit(
+                'HEAD', signature, signature,
+                f"Merge branch '{branch}' of {remote}",
+                tree, [self.repo.head.target, remote_target]
+            )
+            self.repo.state_cleanup()
+
+        self.logger.info("Changes pulled successfully")
+        return True
+
+    def read_blob(self, sha: str) -> Optional[bytes]:
+        """
+        Read the raw contents of a blob.
+
+        With GitPython the object database is backed by a persistent
+        ``git cat-file --batch`` process, so repeated reads don't fork git.
+
+        Args:
+            sha: Hex SHA of the blob
+
+        Returns:
+            Blob contents or None on failure
+        """
+        if not self._ensure_repo_loaded():
+            return None
+
+        try:
+            if self.backend == 'pygit2':
+                return self.repo[sha].read_raw()
+
+            if self._odb is None:
+                self._odb = self.repo.odb
+            return self._odb.stream(bytes.fromhex(sha)).read()
+        except Exception as e:
+            self.logger.error("Failed to read blob %s: %s", sha, e)
+            return None
+
+    def get_file_history(self, path: str, max_count: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the commits that touched a file, newest first.
+
+        Args:
+            path: File path relative to the repository root
+            max_count: Maximum number of commits to return (default: all)
+
+        Returns:
+            List of dictionaries with 'hexsha', 'author', 'date', 'message'
+            and 'blob' (hex SHA of the file at that commit, None if deleted),
+            or None on failure
+        """
+        if not self._ensure_repo_loaded():
+            return None
+
+        try:
+            if self.backend == 'pygit2':
+                return self._get_file_history_pygit2(path, max_count)
+
+            history = []
+            # A single rev-list walk; trees are read through the batch odb
+            for commit in self.repo.iter_commits(paths=path, max_count=max_count):
+                try:
+                    blob = (commit.tree / path).hexsha
+                except KeyError:
+                    blob = None
+                history.append({
+                    'hexsha': commit.hexsha,
+                    'author': commit.author.name,
+                    'date': commit.authored_datetime,
+                    'message': commit.message,
+                    'blob': blob,
+                })
+            return history
+        except Exception as e:
+            self.logger.error("Failed to get history for %s: %s", path, e)
+            return None
+
+    def _get_file_history_pygit2(self, path: str, max_count: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        Walk history in-process and keep commits that changed the file.
+
+        Args:
+            path: File path relative to the repository root
+            max_count: Maximum number of commits to return
+
+        Returns:
+            List of history entries as described in get_file_history
+        """
+        def blob_id(commit):
+            try:
+                return commit.tree[path].id
+            except KeyError:
+                return None
+
+        history = []
+        if self.repo.head_is_unborn:
+            return history
+
+        for commit in self.repo.walk(self.repo.head.target):
+            if max_count is not None and len(history) >= max_count:
+                break
+
+            blob = blob_id(commit)
+            parent_blob = blob_id(commit.parents[0]) if commit.parents else None
+            if blob == parent_blob:
+                continue
+
+            history.append({
+                'hexsha': str(commit.id),
+                'author': commit.author.name,
+                'date': datetime.fromtimestamp(
+                    commit.author.time, timezone(timedelta(minutes=commit.author.offset))
+                ),
+                'message': commit.message,
+                'blob': str(blob) if blob is not None else None,
+            })
+
+        return history
+
+
+def _run_batch(args) -> bool:
+    """
+    Run the requested commands on every config given via --configs.
+
+    Each command runs concurrently across repositories; commands run in the
+    same order as for a single repository.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        True if every operation succeeded, False otherwise
+    """
+    config_paths = [path for path in args.configs.split(',') if path]
+    options = {'max_workers': args.parallel, 'use_config_cache': not args.no_config_cache}
+
+    steps = []
+    if args.clone or args.force_clone:
+        steps.append(('clone_repository', (), {'force': args.force_clone}))
+    if args.pull:
+        steps.append(('pull_changes', (), {}))
+    if args.commit:
+        steps.append(('commit_changes', (args.commit,), {}))
+    if args.push:
+        steps.append(('push_changes', (), {}))
+
+    for method_name, method_args, method_kwargs in steps:
+        results = GitRepoManager.run_parallel(
+            config_paths, method_name, *method_args, **options, **method_kwargs
+        )
+        if not all(results.values()):
+            return False
+
+    success = True
+    if args.status:
+        results = GitRepoManager.run_parallel(config_paths, 'get_status', **options)
+        for config_path, status in results.items():
+            if status is None:
+                # The manager could not be created or the status query failed
+                success = False
+            elif status:
+                print(f"\nRepository Status ({config_path}):")
+                print(status)
+
+    return success
+
 
 def main():
     """Main function demonstrating usage."""
@@ -400,46 +1802,60 @@ def main():
     parser.add_argument('--push', action='store_true', help='Push changes')
     parser.add_argument('--pull', action='store_true', help='Pull changes')
     parser.add_argument('--status', action='store_true', help='Show repository status')
+    parser.add_argument('--no-config-cache', action='store_true',
+                        help='Always re-parse the config file, ignoring cached copies')
+    parser.add_argument('--configs', type=str,
+                        help='Comma-separated config files to process concurrently')
+    parser.add_argument('--parallel', type=int, metavar='N',
+                        help='Number of repositories processed at once with --configs')
 
     args = parser.parse_args()
 
-    try:
-        # Initialize manager
-        manager = GitRepoManager(args.config)
+    # Without a command there is nothing to do; skip loading the config
+    commands = (args.clone, args.force_clone, args.commit, args.push, args.pull, args.status)
+    if not any(commands):
+        parser.print_help()
+        return
 
-        # Execute commands
-        if args.clone or args.force_clone:
-            success = manager.clone_repository(force=args.force_clone)
-            if not success:
-                sys.exit(1)
-
-        if args.pull:
-            success = manager.pull_changes()
-            if not success:
-                sys.exit(1)
-
-        if args.commit:
-            success = manager.commit_changes(args.commit)
-            if not success:
-                sys.exit(1)
-
-        if args.push:
-            success = manager.push_changes()
-            if not success:
+    try:
+        if args.configs:
+            if not _run_batch(args):
                 sys.exit(1)
-
-        if args.status:
-            status = manager.get_status()
-            if status:
-                print("\nRepository Status:")
-                print(status)
-
-        # If no arguments, show help
-        if not any([args.clone, args.force_clone, args.commit, args.push, args.pull, args.status]):
-            parser.print_help()
+        else:
+            # Initialize manager
+            manager = GitRepoManager(args.config, use_config_cache=not args.no_config_cache)
+
+            # Execute commands
+            if args.clone or args.force_clone:
+                success = manager.clone_repository(force=args.force_clone)
+                if not success:
+                    sys.exit(1)
+
+            if args.pull:
+                success = manager.pull_changes()
+                if not success:
+                    sys.exit(1)
+
+            if args.commit:
+                success = manager.commit_changes(args.commit)
+                if not success:
+                    sys.exit(1)
+
+            if args.push:
+                success = manager.push_changes()
+                if not success:
+                    sys.exit(1)
+
+            if args.status:
+                status = manager.get_status()
+                if status is None:
+                    sys.exit(1)
+                if status:
+                    print("\nRepository Status:")
+                    print(status)
 
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 